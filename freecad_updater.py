@@ -1,38 +1,126 @@
 import os
-import requests
+import errno
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
-from py7zr import SevenZipFile
 import re
 import json
+import queue
 import tempfile
 import shutil
+import stat
 import threading
+import time
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Constants
-GITHUB_API_URL = "https://api.github.com/repos/FreeCAD/FreeCAD/releases"
+# Only the newest few releases are needed; /releases/latest skips the weekly pre-releases
+GITHUB_API_URL = "https://api.github.com/repos/FreeCAD/FreeCAD/releases?per_page=5"
 VERSION_FILE = "last_version.json"
 CONFIG_FILE = "config.json"
 DOWNLOADS_DIR = "downloads"
+COPY_BUFFER_SIZE = 256 * 1024
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+PROGRESS_INTERVAL = 0.05  # seconds between progress callbacks (~20 Hz)
+PROGRESS_DRAIN_MS = 50  # how often the UI picks up the latest progress value
+PARALLEL_CONNECTIONS = 4  # used when config.json has "parallel_downloads": true
+
+def _make_session():
+    # One pooled keep-alive session for all HTTP calls: TLS connections to
+    # api.github.com and the download host are reused instead of re-handshaked.
+    # requests is imported here so its import cost is not paid before the window shows
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    session = requests.Session()
+    session.headers.update({"User-Agent": "FreeCAD-Updater"})
+    # raise_on_status=False: once retries run out, the last 5xx response is returned
+    # so raise_for_status() turns it into the HTTPError the UI handlers expect
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _session():
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _make_session()
+        return _SESSION
+
+# Read once at import, while single-threaded: os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+_WEEKLY_RE = re.compile(r"^FreeCAD_weekly-\d{4}\.\d{2}\.\d{2}-Windows-x86_64-py311\.7z$")
+_VER_RE = re.compile(r"FreeCAD\s+([^\s,()]+)", re.IGNORECASE)
+# Revision formats in priority order; the first pattern that matches anywhere wins
+_REV_RES = tuple(re.compile(rp, re.IGNORECASE) for rp in (
+    r"Revision[:\s]*([0-9A-Za-z\-]+)",
+    r"\brev(?:ision)?[:\s]*([0-9A-Za-z\-]+)",
+    r"commit[:\s]*([0-9a-f]{7,40})",
+    r"\b([0-9a-f]{7,40})\b",
+))
+
+def get_latest_weekly_asset(cfg=None):
+    """
+    Return {"name", "url"} of the newest weekly Windows build, or None.
+    The releases ETag and the matched asset are kept in config.json so repeat
+    checks use a conditional request (304 = nothing changed, no body to parse).
+    """
+    if cfg is None:
+        cfg = load_config()
+    cached_asset = cfg.get("latest_asset")
+    # Honor GitHub's X-Poll-Interval from the previous response
+    if "latest_asset" in cfg and time.time() < cfg.get("releases_poll_until", 0):
+        return cached_asset
 
-def get_latest_weekly_asset():
-    headers = {"Accept": "application/vnd.github.v3+json", "User-Agent": "FreeCAD-Updater"}
-    response = requests.get(GITHUB_API_URL, headers=headers, timeout=15)
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if cfg.get("releases_etag") and "latest_asset" in cfg:
+        headers["If-None-Match"] = cfg["releases_etag"]
+    response = _session().get(GITHUB_API_URL, headers=headers, timeout=15)
+
+    poll_interval = 0
+    try:
+        poll_interval = int(response.headers.get("X-Poll-Interval", 0) or 0)
+    except ValueError:
+        pass
+    if poll_interval:
+        cfg["releases_poll_until"] = time.time() + poll_interval
+    else:
+        cfg.pop("releases_poll_until", None)
+
+    if response.status_code == 304:
+        save_config(cfg)
+        return cached_asset
     response.raise_for_status()
     releases = response.json()
-    pattern = re.compile(r"^FreeCAD_weekly-\d{4}\.\d{2}\.\d{2}-Windows-x86_64-py311\.7z$")
+    found = None
     for release in releases:
         for asset in release.get("assets", []):
             name = asset.get("name", "")
-            if pattern.match(name):
-                return {
+            if _WEEKLY_RE.match(name):
+                found = {
                     "name": name,
                     "url": asset.get("browser_download_url")
                 }
-    return None
+                break
+        if found:
+            break
+
+    cfg["latest_asset"] = found
+    if response.headers.get("ETag"):
+        cfg["releases_etag"] = response.headers["ETag"]
+    else:
+        cfg.pop("releases_etag", None)
+    save_config(cfg)
+    return found
 
 def load_last_version():
     if os.path.exists(VERSION_FILE):
@@ -43,9 +131,33 @@ def load_last_version():
                 return None
     return None
 
+def _atomic_write_json(path, obj):
+    # serialize up front and write it in one call to a temp file, then rename
+    # over the target so a crash mid-write never leaves a truncated file behind;
+    # each write gets its own temp file so concurrent saves cannot interleave
+    data = json.dumps(obj).encode("utf-8")
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                               dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates the file 0600; keep the target's mode (or the usual
+        # umask default for a new file) so the rename does not change permissions
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except OSError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 def save_last_version(version):
-    with open(VERSION_FILE, "w", encoding="utf-8") as f:
-        json.dump({"version": version}, f)
+    _atomic_write_json(VERSION_FILE, {"version": version})
 
 def load_config():
     if os.path.exists(CONFIG_FILE):
@@ -58,8 +170,7 @@ def load_config():
 
 def save_config(cfg):
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f)
+        _atomic_write_json(CONFIG_FILE, cfg)
     except Exception:
         pass
 
@@ -83,116 +194,418 @@ def _win_long_path(p):
     # normal path -> \\?\C:\...
     return r'\\?\\' + p
 
-def copy_contents(src_dir, dst_dir):
-    """
-    Copy tree from src_dir into dst_dir. Handles very long Windows paths and
-    falls back to a manual copy if shutil.copy2 fails.
-    """
-    for root, dirs, files in os.walk(src_dir):
-        rel = os.path.relpath(root, src_dir)
-        dest_root = os.path.join(dst_dir, rel) if rel != "." else dst_dir
+def _makedirs(path):
+    try:
+        os.makedirs(path, exist_ok=True)
+    except Exception:
+        # try long-path mkdir on Windows
+        if os.name == "nt":
+            try:
+                os.makedirs(_win_long_path(path), exist_ok=True)
+            except Exception as e:
+                raise Exception(f"Error creating directory {path}: {e}")
+        else:
+            raise
+
+def _fast_copy(src, dst):
+    # On Windows copy2 is kept: on Python 3.12+ it uses the native CopyFile2,
+    # which copyfile does not. Elsewhere copyfile already picks the platform
+    # fast path (sendfile on Linux, fcopyfile on macOS); dst is always a full
+    # file path here, so the isdir() stat that copy2 does first is skipped
+    if os.name == "nt":
+        shutil.copy2(src, dst)
+        return
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+def _copy_file(src_file, dst_file):
+    # Try a normal copy first; fall back to long-path or manual copy
+    try:
+        _fast_copy(src_file, dst_file)
+    except FileNotFoundError as fnf:
+        # likely long path issue on Windows: retry with \\?\ prefix
+        if os.name == "nt":
+            try:
+                s = _win_long_path(src_file)
+                d = _win_long_path(dst_file)
+                _fast_copy(s, d)
+            except Exception as e:
+                # final fallback: manual copy with long-path handling
+                try:
+                    with open(_win_long_path(src_file), "rb") as sf, open(_win_long_path(dst_file), "wb") as df:
+                        shutil.copyfileobj(sf, df, COPY_BUFFER_SIZE)
+                    try:
+                        shutil.copystat(_win_long_path(src_file), _win_long_path(dst_file))
+                    except Exception:
+                        pass
+                except Exception as e2:
+                    raise Exception(f"Error copying {src_file} -> {dst_file}: {e2}") from e2
+        else:
+            raise Exception(f"Error copying {src_file} -> {dst_file}: {fnf}") from fnf
+    except OSError as oe:
+        # fallback to manual copy (permission/other issues)
         try:
-            os.makedirs(dest_root, exist_ok=True)
-        except Exception:
-            # try long-path mkdir on Windows
+            with open(src_file, "rb") as sf, open(dst_file, "wb") as df:
+                shutil.copyfileobj(sf, df, COPY_BUFFER_SIZE)
+            try:
+                shutil.copystat(src_file, dst_file)
+            except Exception:
+                pass
+        except Exception as e:
+            # Try long-path manual copy on Windows
             if os.name == "nt":
                 try:
-                    os.makedirs(_win_long_path(dest_root), exist_ok=True)
-                except Exception as e:
-                    raise Exception(f"Error creating directory {dest_root}: {e}")
+                    with open(_win_long_path(src_file), "rb") as sf, open(_win_long_path(dst_file), "wb") as df:
+                        shutil.copyfileobj(sf, df, COPY_BUFFER_SIZE)
+                    try:
+                        shutil.copystat(_win_long_path(src_file), _win_long_path(dst_file))
+                    except Exception:
+                        pass
+                except Exception as e2:
+                    raise Exception(f"Error copying {src_file} -> {dst_file}: {e2}") from e2
             else:
-                raise
+                raise Exception(f"Error copying {src_file} -> {dst_file}: {oe}") from oe
 
-        for fname in files:
-            src_file = os.path.join(root, fname)
-            dst_file = os.path.join(dest_root, fname)
+def _walk_fast(path, rel=""):
+    """
+    Recursive os.scandir walk yielding (full_src_path, relative_path, entry).
+    Directories are yielded before their contents; DirEntry caches the type
+    (and on Windows the stat) from the directory read itself.
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+    for entry in entries:
+        entry_rel = os.path.join(rel, entry.name) if rel else entry.name
+        yield entry.path, entry_rel, entry
+        # like os.walk: list symlinked folders but do not descend into them
+        if entry.is_dir() and not entry.is_symlink():
+            yield from _walk_fast(entry.path, entry_rel)
+
+def _robocopy(src_dir, dst_dir):
+    # /MT:16 copies on 16 threads, /J uses unbuffered I/O (good for the large .dll/.lib files);
+    # like the Python path, robocopy skips files whose size and timestamp already match
+    cmd = ["robocopy", src_dir, dst_dir, "/E", "/MT:16", "/J", "/R:2", "/W:1",
+           "/NFL", "/NDL", "/NP", "/NS", "/NJH", "/NJS"]
+    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
+    # exit codes 0-7 are success (bit flags for copied/extra/mismatched files), 8+ means failures
+    if p.returncode > 7:
+        raise Exception(f"Error copying {src_dir} -> {dst_dir}: robocopy exit code {p.returncode}: {(p.stderr or p.stdout).strip()}")
 
-            # Ensure dst parent exists (again, for safety)
-            try:
-                os.makedirs(os.path.dirname(dst_file), exist_ok=True)
-            except Exception:
-                if os.name == "nt":
-                    try:
-                        os.makedirs(_win_long_path(os.path.dirname(dst_file)), exist_ok=True)
-                    except Exception as e:
-                        raise Exception(f"Error creating directory {os.path.dirname(dst_file)}: {e}")
-                else:
-                    raise
+def copy_contents(src_dir, dst_dir):
+    """
+    Copy tree from src_dir into dst_dir. Handles very long Windows paths and
+    falls back to a manual copy if the fast copy fails.
+    On Windows the copy is delegated to robocopy when it is available.
+    Otherwise the directory tree is created first so the file copies are independent
+    and can run on a thread pool (the work is bound by syscall latency).
+    Files whose size and mtime already match the destination are skipped.
+    """
+    if sys.platform == "win32" and shutil.which("robocopy"):
+        _robocopy(src_dir, dst_dir)
+        return
+    _makedirs(dst_dir)
+    pairs = []
+    for src_path, rel, entry in _walk_fast(src_dir):
+        dst_path = os.path.join(dst_dir, rel)
+        if entry.is_dir():
+            _makedirs(dst_path)
+            continue
+        # skip files already present with the same size and mtime (copystat keeps mtime)
+        try:
+            src_st = entry.stat()
+            dst_st = os.stat(dst_path)
+            if dst_st.st_size == src_st.st_size and dst_st.st_mtime_ns == src_st.st_mtime_ns:
+                continue
+        except OSError:
+            pass
+        pairs.append((src_path, dst_path))
+
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        # list() re-raises the first copy error in the caller
+        list(ex.map(lambda p: _copy_file(*p), pairs))
 
-            # Try a normal copy first; fall back to long-path or manual copy
+def move_contents(src_dir, dst_dir):
+    """
+    Move tree from src_dir into dst_dir, merging into existing subfolders.
+    Uses os.replace (a rename) per entry and only falls back to copying when
+    src_dir and dst_dir are on different volumes.
+    Deep paths on Windows are retried with the \\?\ long-path prefix.
+    """
+    _makedirs(dst_dir)
+    try:
+        with os.scandir(src_dir) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        if os.name != "nt":
+            raise
+        with os.scandir(_win_long_path(src_dir)) as it:
+            entries = list(it)
+    for entry in entries:
+        target = os.path.join(dst_dir, entry.name)
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if is_dir and os.path.isdir(_win_long_path(target)):
+            # existing folder: merge recursively instead of replacing it wholesale
+            move_contents(entry.path, target)
+            continue
+        try:
+            os.replace(entry.path, target)
+            continue
+        except OSError as oe:
+            err = oe
+        if os.name == "nt" and err.errno != errno.EXDEV:
+            # likely a path over MAX_PATH without LongPathsEnabled: retry with \\?\ prefix
             try:
-                shutil.copy2(src_file, dst_file)
-            except FileNotFoundError as fnf:
-                # likely long path issue on Windows: retry with \\?\ prefix
-                if os.name == "nt":
-                    try:
-                        s = _win_long_path(src_file)
-                        d = _win_long_path(dst_file)
-                        shutil.copy2(s, d)
-                    except Exception as e:
-                        # final fallback: manual copy with long-path handling
-                        try:
-                            with open(_win_long_path(src_file), "rb") as sf, open(_win_long_path(dst_file), "wb") as df:
-                                shutil.copyfileobj(sf, df)
-                            try:
-                                shutil.copystat(_win_long_path(src_file), _win_long_path(dst_file))
-                            except Exception:
-                                pass
-                        except Exception as e2:
-                            raise Exception(f"Error copying {src_file} -> {dst_file}: {e2}") from e2
-                else:
-                    raise Exception(f"Error copying {src_file} -> {dst_file}: {fnf}") from fnf
+                os.replace(_win_long_path(entry.path), _win_long_path(target))
+                continue
             except OSError as oe:
-                # fallback to manual copy (permission/other issues)
-                try:
-                    with open(src_file, "rb") as sf, open(dst_file, "wb") as df:
-                        shutil.copyfileobj(sf, df)
-                    try:
-                        shutil.copystat(src_file, dst_file)
-                    except Exception:
-                        pass
-                except Exception as e:
-                    # Try long-path manual copy on Windows
-                    if os.name == "nt":
-                        try:
-                            with open(_win_long_path(src_file), "rb") as sf, open(_win_long_path(dst_file), "wb") as df:
-                                shutil.copyfileobj(sf, df)
+                err = oe
+        if err.errno != errno.EXDEV:
+            raise Exception(f"Error moving {entry.path} -> {target}: {err}") from err
+        # different volume: copy instead (the staging folder is removed afterwards)
+        if is_dir:
+            copy_contents(entry.path, target)
+        else:
+            _copy_file(entry.path, target)
+            os.unlink(_win_long_path(entry.path))
+
+def _download_parallel(url, headers, out_path, size, validator=None, progress_callback=None, parts=PARALLEL_CONNECTIONS):
+    """
+    Download url into out_path using `parts` concurrent Range requests.
+    Each worker writes its own slice of a preallocated .part file, which is
+    renamed to out_path only once every slice is complete.
+    The first failing slice stops the others and its error is raised.
+    """
+    part_path = out_path + ".part"
+    with open(part_path, "wb") as f:
+        f.truncate(size)
+
+    step = -(-size // parts)
+    ranges = [(lo, min(lo + step, size) - 1) for lo in range(0, size, step)]
+    lock = threading.Lock()
+    state = {"downloaded": 0, "last_emit": 0.0}
+    stop = threading.Event()
+
+    def fetch(lo, hi):
+        range_headers = dict(headers)
+        range_headers["Range"] = f"bytes={lo}-{hi}"
+        if validator:
+            # all slices must come from the same version of the file
+            range_headers["If-Range"] = validator
+        resp = _session().get(url, headers=range_headers, stream=True, timeout=60)
+        resp.raise_for_status()
+        if resp.status_code != 206:
+            resp.close()
+            raise Exception(f"Server did not honor range request bytes={lo}-{hi} (HTTP {resp.status_code}).")
+        received = 0
+        with open(part_path, "r+b") as f:
+            f.seek(lo)
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if stop.is_set():
+                    # another slice failed: the download is abandoned
+                    resp.close()
+                    return
+                if chunk:
+                    f.write(chunk)
+                    received += len(chunk)
+                    with lock:
+                        state["downloaded"] += len(chunk)
+                        now = time.monotonic()
+                        if progress_callback and (now - state["last_emit"] >= PROGRESS_INTERVAL or state["downloaded"] == size):
+                            state["last_emit"] = now
                             try:
-                                shutil.copystat(_win_long_path(src_file), _win_long_path(dst_file))
+                                progress_callback(state["downloaded"], size)
                             except Exception:
                                 pass
-                        except Exception as e2:
-                            raise Exception(f"Error copying {src_file} -> {dst_file}: {e2}") from e2
-                    else:
-                        raise Exception(f"Error copying {src_file} -> {dst_file}: {oe}") from oe
+        if received != hi - lo + 1:
+            raise Exception(f"Incomplete download of bytes={lo}-{hi}: got {received} bytes.")
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+            futures = [ex.submit(fetch, lo, hi) for lo, hi in ranges]
+            try:
+                for fut in as_completed(futures):
+                    fut.result()
+            except Exception:
+                stop.set()
+                for fut in futures:
+                    fut.cancel()
+                raise
+    except Exception:
+        try:
+            os.unlink(part_path)
+        except Exception:
+            pass
+        raise
+    os.replace(part_path, out_path)
 
-def download_and_extract(asset, install_dir, progress_callback=None):
+def _find_7z():
+    """
+    Return the path of a 7z.exe to use for extraction, or None.
+    """
+    # 1) If running as PyInstaller onefile/onedir, check the extracted bundle folder (sys._MEIPASS)
+    meipass = getattr(sys, "_MEIPASS", None)
+    if meipass:
+        candidate = os.path.join(meipass, "7z.exe")
+        if os.path.isfile(candidate):
+            return candidate
+
+    # 2) If running frozen, also check next to the exe (useful with --add-binary in onedir)
+    if getattr(sys, "frozen", False):
+        exe_dir = os.path.dirname(sys.executable)
+        candidate = os.path.join(exe_dir, "7z.exe")
+        if os.path.isfile(candidate):
+            return candidate
+
+    # 3) Finally check PATH and common Program Files location
+    seven = shutil.which("7z") or shutil.which("7z.exe")
+    if seven:
+        return seven
+    pf = os.environ.get("ProgramFiles", r"C:\Program Files")
+    candidate = os.path.join(pf, "7-Zip", "7z.exe")
+    if os.path.isfile(candidate):
+        return candidate
+    return None
+
+def _extract_7z(archive, dest):
+    """
+    Extract a .7z archive into dest.
+    The native 7z.exe is tried first (multithreaded LZMA2, several times faster
+    than py7zr); py7zr and then the Windows Shell are used as fallbacks.
+    """
+    # 1) Try external 7z.exe first
+    seven = _find_7z()
+    seven_error = None
+    if seven:
+        try:
+            # -bso0/-bsp0: no per-file output or progress to pipe back
+            cmd = [seven, "x", "-y", "-bso0", "-bsp0", f"-o{dest}", archive]
+            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=300)
+            return
+        except subprocess.CalledProcessError as ce:
+            seven_error = Exception(f"7z extraction failed: {ce.stderr or ce.stdout}")
+        except Exception as e:
+            seven_error = e
+
+    # 2) Fallback: py7zr (imported only here; it loads several C extensions)
+    py7zr_error = None
+    try:
+        from py7zr import SevenZipFile
+        with SevenZipFile(archive, mode='r') as sz:
+            sz.extractall(path=dest)
+        return
+    except Exception as e_py:
+        py7zr_error = e_py
+
+    if seven_error:
+        raise Exception(f"7z extraction failed: {seven_error}. py7zr error: {py7zr_error}") from seven_error
+
+    # 3) Fallback: try Windows Shell (Explorer) if pywin32 available and shell extension for .7z is registered
+    try:
+        import importlib
+        try:
+            win32com_client = importlib.import_module("win32com.client")
+        except ModuleNotFoundError as mnfe:
+            # Explicitly surface a clear error if pywin32 is not installed
+            raise Exception("pywin32 (win32com) is not installed; cannot use Explorer shell to extract .7z archives.") from mnfe
+
+        Dispatch = win32com_client.Dispatch
+        shell = Dispatch("Shell.Application")
+        archive_ns = shell.NameSpace(archive)
+        if archive_ns is None:
+            raise Exception("Shell cannot open archive (no shell extension for .7z).")
+        dest_ns = shell.NameSpace(dest)
+        dest_ns.CopyHere(archive_ns.Items(), 20)  # 20 = no UI + do not show progress
+        # wait for files to appear (timeout)
+        deadline = time.time() + 120
+        while time.time() < deadline:
+            if any(os.scandir(dest)):
+                break
+            time.sleep(0.5)
+        else:
+            raise Exception("Shell extraction timed out.")
+    except Exception as e_shell:
+        msg = str(py7zr_error) if py7zr_error else "unknown py7zr error"
+        raise Exception(
+            "Could not extract archive. py7zr failed and no 7z.exe found. "
+            "If you can extract this file in Explorer, that means a shell extension (e.g. 7‑Zip) is installed — install 7‑Zip or pywin32. "
+            f"py7zr error: {msg}. Shell error: {e_shell}"
+        ) from e_shell
+
+def download_and_extract(asset, install_dir, progress_callback=None, parallel=False):
     if not install_dir:
         raise Exception("Installation folder not specified.")
     os.makedirs(install_dir, exist_ok=True)
     os.makedirs(DOWNLOADS_DIR, exist_ok=True)
 
-    headers = {"User-Agent": "FreeCAD-Updater"}
-
-    # Try to obtain remote size (HEAD)
-    remote_size = 0
-    try:
-        head = requests.head(asset["url"], headers=headers, timeout=15, allow_redirects=True)
-        remote_size = int(head.headers.get("content-length", 0) or 0)
-    except Exception:
-        remote_size = 0
+    headers = {}
 
     cached_file = os.path.join(DOWNLOADS_DIR, asset["name"])
-    use_cached = False
-    if os.path.isfile(cached_file) and remote_size:
+    sentinel_file = cached_file + ".ok"
+    existing = 0
+    if os.path.isfile(cached_file):
+        try:
+            existing = os.path.getsize(cached_file)
+        except Exception:
+            existing = 0
+
+    # A sentinel written after the last successful extraction marks the cached
+    # archive as complete, so the HEAD round trip is not needed to verify it
+    sentinel = None
+    if existing and os.path.isfile(sentinel_file):
+        try:
+            with open(sentinel_file, "r", encoding="utf-8") as f:
+                sentinel = json.load(f)
+        except Exception:
+            sentinel = None
+    trusted = isinstance(sentinel, dict) and sentinel.get("size") == existing
+
+    remote_size = 0
+    validator = None
+    etag = None
+    accept_ranges = False
+    if trusted:
+        remote_size = existing
+        etag = sentinel.get("etag")
+    else:
+        # stale or missing sentinel: drop it until this archive extracts cleanly again
+        try:
+            os.unlink(sentinel_file)
+        except OSError:
+            pass
+        # Try to obtain remote size and validators (HEAD)
         try:
-            if os.path.getsize(cached_file) == remote_size:
-                use_cached = True
+            head = _session().head(asset["url"], headers=headers, timeout=15, allow_redirects=True)
+            remote_size = int(head.headers.get("content-length", 0) or 0)
+            accept_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+            # If-Range needs a strong validator: skip weak ETags and use Last-Modified instead
+            etag = head.headers.get("ETag")
+            if etag and not etag.startswith("W/"):
+                validator = etag
+            else:
+                validator = head.headers.get("Last-Modified")
         except Exception:
-            use_cached = False
+            remote_size = 0
+    use_cached = bool(remote_size) and existing == remote_size
 
-    temp_dir = tempfile.mkdtemp(prefix="freecad_updater_")
+    # Stage the extraction next to install_dir so it sits on the same volume as the target
+    try:
+        staging_parent = os.path.dirname(os.path.abspath(install_dir))
+        temp_dir = tempfile.mkdtemp(prefix=".freecad_updater_", dir=staging_parent)
+    except Exception:
+        temp_dir = tempfile.mkdtemp(prefix="freecad_updater_")
     try:
+        fetched_parallel = False
+        if not use_cached and parallel and accept_ranges and remote_size and not existing:
+            # Fresh download from a range-capable server: fetch slices concurrently
+            try:
+                _download_parallel(asset["url"], headers, cached_file, remote_size,
+                                   validator=validator, progress_callback=progress_callback)
+                fetched_parallel = True
+            except Exception:
+                # any failed slice: fall back to the single-stream download below
+                pass
+
         # If cached file is valid, reuse it
         if use_cached:
             temp_file = cached_file
@@ -203,19 +616,51 @@ def download_and_extract(asset, install_dir, progress_callback=None):
                     progress_callback(downloaded, total)
                 except Exception:
                     pass
+        elif fetched_parallel:
+            temp_file = cached_file
         else:
-            # Download and save into cache (overwrites existing incomplete file)
+            # Download into cache, resuming a partial file with a Range request when possible
             out_path = cached_file
-            resp = requests.get(asset["url"], headers=headers, stream=True, timeout=60)
+            get_headers = dict(headers)
+            if remote_size and 0 < existing < remote_size:
+                get_headers["Range"] = f"bytes={existing}-"
+                if validator:
+                    get_headers["If-Range"] = validator
+            else:
+                existing = 0
+            resp = _session().get(asset["url"], headers=get_headers, stream=True, timeout=60)
+            if resp.status_code == 416:
+                # range not satisfiable: drop the partial file and fetch from scratch
+                resp.close()
+                existing = 0
+                resp = _session().get(asset["url"], headers=headers, stream=True, timeout=60)
             resp.raise_for_status()
-            total = int(resp.headers.get("content-length", 0) or remote_size or 0)
-            downloaded = 0
-            with open(out_path, "wb") as f:
-                for chunk in resp.iter_content(chunk_size=8192):
+            length = int(resp.headers.get("content-length", 0) or 0)
+            if existing and resp.status_code == 206:
+                # server honored the range: append the remaining bytes
+                mode = "ab"
+                downloaded = existing
+                total = existing + length if length else remote_size
+            else:
+                # 200 (range ignored or file changed): overwrite the incomplete file
+                mode = "wb"
+                downloaded = 0
+                total = length or remote_size or 0
+            if progress_callback and downloaded:
+                try:
+                    progress_callback(downloaded, total)
+                except Exception:
+                    pass
+            with open(out_path, mode) as f:
+                last_emit = 0.0
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
-                        if progress_callback:
+                        # throttle callbacks so the Tk event queue is not flooded
+                        now = time.monotonic()
+                        if progress_callback and (now - last_emit >= PROGRESS_INTERVAL or downloaded == total):
+                            last_emit = now
                             try:
                                 progress_callback(downloaded, total)
                             except Exception:
@@ -226,77 +671,21 @@ def download_and_extract(asset, install_dir, progress_callback=None):
         extract_dir = os.path.join(temp_dir, "extracted")
         os.makedirs(extract_dir, exist_ok=True)
 
-        # 1) Try py7zr first
-        py7zr_error = None
         try:
-            with SevenZipFile(temp_file, mode='r') as archive:
-                archive.extractall(path=extract_dir)
-        except Exception as e_py:
-            py7zr_error = e_py
-
-            # 2) Fallback: try external 7z.exe
-            seven = None
-            # 1) If running as PyInstaller onefile/onedir, check the extracted bundle folder (sys._MEIPASS)
-            meipass = getattr(sys, "_MEIPASS", None)
-            if meipass:
-                candidate = os.path.join(meipass, "7z.exe")
-                if os.path.isfile(candidate):
-                    seven = candidate
-
-            # 2) If running frozen, also check next to the exe (useful with --add-binary in onedir)
-            if not seven and getattr(sys, "frozen", False):
-                exe_dir = os.path.dirname(sys.executable)
-                candidate = os.path.join(exe_dir, "7z.exe")
-                if os.path.isfile(candidate):
-                    seven = candidate
-
-            # 3) Finally check PATH and common Program Files location
-            if not seven:
-                seven = shutil.which("7z") or shutil.which("7z.exe")
-            if not seven:
-                pf = os.environ.get("ProgramFiles", r"C:\Program Files")
-                candidate = os.path.join(pf, "7-Zip", "7z.exe")
-                if os.path.isfile(candidate):
-                    seven = candidate
-            if seven:
-                try:
-                    cmd = [seven, "x", "-y", f"-o{extract_dir}", temp_file]
-                    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=300)
-                except subprocess.CalledProcessError as ce:
-                    raise Exception(f"7z extraction failed: {ce.stderr or ce.stdout}") from ce
-            else:
-                # 3) Fallback: try Windows Shell (Explorer) if pywin32 available and shell extension for .7z is registered
+            _extract_7z(temp_file, extract_dir)
+        except Exception:
+            # an archive that does not extract is corrupt even if its size matches:
+            # drop it with its sentinel so the next run downloads it again
+            for path in (sentinel_file, cached_file):
                 try:
-                    import time
-                    import importlib
-                    try:
-                        win32com_client = importlib.import_module("win32com.client")
-                    except ModuleNotFoundError as mnfe:
-                        # Explicitly surface a clear error if pywin32 is not installed
-                        raise Exception("pywin32 (win32com) is not installed; cannot use Explorer shell to extract .7z archives.") from mnfe
-
-                    Dispatch = win32com_client.Dispatch
-                    shell = Dispatch("Shell.Application")
-                    archive_ns = shell.NameSpace(temp_file)
-                    if archive_ns is None:
-                        raise Exception("Shell cannot open archive (no shell extension for .7z).")
-                    dest_ns = shell.NameSpace(extract_dir)
-                    dest_ns.CopyHere(archive_ns.Items(), 20)  # 20 = no UI + do not show progress
-                    # wait for files to appear (timeout)
-                    deadline = time.time() + 120
-                    while time.time() < deadline:
-                        if any(os.scandir(extract_dir)):
-                            break
-                        time.sleep(0.5)
-                    else:
-                        raise Exception("Shell extraction timed out.")
-                except Exception as e_shell:
-                    msg = str(py7zr_error) if py7zr_error else "unknown py7zr error"
-                    raise Exception(
-                        "Could not extract archive. py7zr failed and no 7z.exe found. "
-                        "If you can extract this file in Explorer, that means a shell extension (e.g. 7‑Zip) is installed — install 7‑Zip or pywin32. "
-                        f"py7zr error: {msg}. Shell error: {e_shell}"
-                    ) from e_shell
+                    os.unlink(path)
+                except OSError:
+                    pass
+            raise
+        try:
+            _atomic_write_json(sentinel_file, {"size": os.path.getsize(temp_file), "etag": etag})
+        except Exception:
+            pass
 
         # Choose root of extracted content
         entries = os.listdir(extract_dir)
@@ -305,7 +694,7 @@ def download_and_extract(asset, install_dir, progress_callback=None):
         else:
             src_root = extract_dir
 
-        copy_contents(src_root, install_dir)
+        move_contents(src_root, install_dir)
 
     finally:
         # remove only the temporary extraction folder; keep cached archive in DOWNLOADS_DIR
@@ -314,9 +703,40 @@ def download_and_extract(asset, install_dir, progress_callback=None):
         except Exception:
             pass
 
-def detect_installed_version(install_dir):
+def _probe_version(exe):
+    """
+    Run exe --version and parse it. Returns (version_text, revision) or None.
+    """
+    p = subprocess.run([exe, "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
+    out = (p.stdout or "").strip()
+    err = (p.stderr or "").strip()
+    text = out if out else err
+    if not text:
+        return None
+
+    # Extract version (e.g. "FreeCAD 0.21.1")
+    m = _VER_RE.search(text)
+    if m:
+        version = f"FreeCAD {m.group(1)}"
+    else:
+        # fallback: first non-empty line
+        version = text.splitlines()[0].strip()
+
+    # Search for revision/commit in various formats
+    rev = None
+    for rp in _REV_RES:
+        rm = rp.search(text)
+        if rm:
+            rev = rm.group(1)
+            break
+
+    return (version, rev)
+
+def detect_installed_version(install_dir, cfg=None):
     """
     Try to detect the installed FreeCAD version by running FreeCAD.exe or FreeCADCmd.exe with --version.
+    Results are cached in config.json keyed on the exe path, mtime and size, so the
+    (slow) process is only started again when the binary changes.
     Returns a tuple (version_text, revision) or (None, None).
     """
     if not install_dir:
@@ -330,35 +750,26 @@ def detect_installed_version(install_dir):
     for exe in exe_candidates:
         if os.path.isfile(exe):
             try:
-                p = subprocess.run([exe, "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
-                out = (p.stdout or "").strip()
-                err = (p.stderr or "").strip()
-                text = out if out else err
-                if not text:
+                st = os.stat(exe)
+                exe_path = os.path.abspath(exe)
+                key = f"{exe_path}:{st.st_mtime_ns}:{st.st_size}"
+                if cfg is None:
+                    cfg = load_config()
+                cache = cfg.get("detected_versions", {})
+                hit = cache.get(key)
+                if hit:
+                    return (hit.get("version"), hit.get("rev"))
+
+                result = _probe_version(exe)
+                if not result:
                     continue
+                version, rev = result
 
-                # Extract version (e.g. "FreeCAD 0.21.1")
-                m = re.search(r"FreeCAD\s+([^\s,()]+)", text, re.IGNORECASE)
-                if m:
-                    version = f"FreeCAD {m.group(1)}"
-                else:
-                    # fallback: first non-empty line
-                    version = text.splitlines()[0].strip()
-
-                # Search for revision/commit in various formats
-                rev = None
-                rev_patterns = [
-                    r"Revision[:\s]*([0-9A-Za-z\-]+)",
-                    r"\brev(?:ision)?[:\s]*([0-9A-Za-z\-]+)",
-                    r"commit[:\s]*([0-9a-f]{7,40})",
-                    r"\b([0-9a-f]{7,40})\b",
-                ]
-                for rp in rev_patterns:
-                    rm = re.search(rp, text, re.IGNORECASE)
-                    if rm:
-                        rev = rm.group(1)
-                        break
-
+                # drop entries for older builds of the same exe before storing this one
+                cache = {k: v for k, v in cache.items() if k.rsplit(":", 2)[0] != exe_path}
+                cache[key] = {"version": version, "rev": rev}
+                cfg["detected_versions"] = cache
+                save_config(cfg)
                 return (version, rev)
             except Exception:
                 continue
@@ -370,9 +781,10 @@ class FreeCADUpdaterApp:
         self.root.title("FreeCAD Weekly Updater")
         self.install_dir = tk.StringVar()
 
-        cfg = load_config()
-        if cfg.get("install_dir"):
-            self.install_dir.set(cfg.get("install_dir"))
+        # config.json is read once; later changes go through _save_cfg()
+        self._cfg = load_config()
+        if self._cfg.get("install_dir"):
+            self.install_dir.set(self._cfg.get("install_dir"))
 
         frm = tk.Frame(root)
         frm.pack(padx=10, pady=10)
@@ -394,6 +806,10 @@ class FreeCADUpdaterApp:
         self.installed_label = tk.Label(frm, text="Installed version: (not detected)", anchor="w")
         self.installed_label.grid(row=5, column=0, columnspan=4, sticky="w", pady=(6,0))
 
+        # Progress from the download thread is coalesced here and drained at a fixed rate
+        self._progress_q = queue.Queue(maxsize=1)
+        self.root.after(PROGRESS_DRAIN_MS, self._drain_progress)
+
         # Do NOT call update_installed_version_label() at startup to avoid any popup or early detection.
         # The user can click "Detect installed version" to populate this field manually.
 
@@ -401,15 +817,13 @@ class FreeCADUpdaterApp:
         folder = filedialog.askdirectory()
         if folder:
             self.install_dir.set(folder)
-            cfg = load_config()
-            cfg["install_dir"] = folder
-            save_config(cfg)
+            self._save_cfg(install_dir=folder)
             # Do not auto-detect at folder select to avoid popups; user should press detect explicitly.
             # self.update_installed_version_label()
 
     def update_installed_version_label(self):
         install_dir = self.install_dir.get()
-        ver, rev = detect_installed_version(install_dir)
+        ver, rev = detect_installed_version(install_dir, self._cfg)
         if ver:
             if rev:
                 self.installed_label.config(text=f"Installed version: {ver} (rev: {rev})")
@@ -417,19 +831,40 @@ class FreeCADUpdaterApp:
                 self.installed_label.config(text=f"Installed version: {ver}")
         else:
             # if detection fails, try reading last_version from config as a fallback
-            cfg = load_config()
-            last = cfg.get("last_version") or load_last_version()
+            last = self._cfg.get("last_version") or load_last_version()
             if last:
                 self.installed_label.config(text=f"Installed version (from record): {last}")
             else:
                 self.installed_label.config(text="Installed version: (not detected)")
 
+    def _save_cfg(self, **updates):
+        self._cfg.update(updates)
+        save_config(self._cfg)
+
     def set_ui_busy(self, busy=True):
         state = "disabled" if busy else "normal"
         self.check_btn.config(state=state)
 
     def update_progress_safe(self, downloaded, total):
-        def ui_update():
+        # Called from the worker thread: keep only the latest value in the
+        # single-slot queue; _drain_progress picks it up on the Tk side
+        item = (downloaded, total)
+        while True:
+            try:
+                self._progress_q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._progress_q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _drain_progress(self):
+        try:
+            downloaded, total = self._progress_q.get_nowait()
+        except queue.Empty:
+            pass
+        else:
             if total:
                 pct = int(downloaded / total * 100)
                 self.progress.config(value=pct)
@@ -439,25 +874,32 @@ class FreeCADUpdaterApp:
                 self.progress.config(mode="indeterminate")
                 self.progress.start(10)
                 self.status.config(text=f"Downloading: {downloaded // 1024} KB")
-        self.root.after(0, ui_update)
+        self.root.after(PROGRESS_DRAIN_MS, self._drain_progress)
 
     def reset_progress_safe(self):
         def ui_reset():
+            # drop a pending update so it cannot repaint the bar after the reset
+            try:
+                self._progress_q.get_nowait()
+            except queue.Empty:
+                pass
             self.progress.stop()
             self.progress.config(mode="determinate", value=0)
             self.status.config(text="")
         self.root.after(0, ui_reset)
 
     def run_update_thread(self, asset, install_dir, latest_version):
+        # self._cfg is only touched on the Tk thread: read what the worker needs
+        # here and hand the config update back through root.after
+        parallel = bool(self._cfg.get("parallel_downloads", False))
+
         def worker():
+            import requests
             try:
                 self.update_progress_safe(0, 1)
-                download_and_extract(asset, install_dir, progress_callback=self.update_progress_safe)
+                download_and_extract(asset, install_dir, progress_callback=self.update_progress_safe, parallel=parallel)
                 save_last_version(latest_version)
-                cfg = load_config()
-                cfg["install_dir"] = install_dir
-                cfg["last_version"] = latest_version
-                save_config(cfg)
+                self.root.after(0, lambda: self._save_cfg(install_dir=install_dir, last_version=latest_version))
                 # update installed version label after copying files
                 self.root.after(0, self.update_installed_version_label)
                 self.root.after(0, lambda: messagebox.showinfo("Update complete", f"Updated to version {latest_version}."))
@@ -475,8 +917,9 @@ class FreeCADUpdaterApp:
         t.start()
 
     def check_and_update(self):
+        import requests
         try:
-            asset = get_latest_weekly_asset()
+            asset = get_latest_weekly_asset(self._cfg)
             if not asset:
                 messagebox.showerror("Error", "No weekly build found.")
                 return
@@ -489,7 +932,7 @@ class FreeCADUpdaterApp:
                 return
 
             # detect installed version (only when user requested)
-            installed_ver = detect_installed_version(install_dir)
+            installed_ver = detect_installed_version(install_dir, self._cfg)
             if isinstance(installed_ver, tuple):
                 v, r = installed_ver
                 if v: